@@ -1,18 +1,27 @@
 """Expose public mason API."""
+import functools
+import importlib
+from typing import Any
 
 from mason import callbacks
 from mason import exceptions
 from mason import library
-from mason import io
 from mason import node
 from mason import port
 
-try:
-    from importlib import metadata  # Python 3.8+
-except ImportError:
-    import importlib_metadata as metadata  # Python 3.7<
-
-__version__ = metadata.version('mason-framework')
+# Serialization pulls in yaml and protobuf, so it is only imported on use.
+_LAZY_ATTRIBUTES = {
+    'io': ('mason.io', ''),
+    'dump_blueprint': ('mason.io', 'dump_blueprint'),
+    'dump_library': ('mason.io', 'dump_library'),
+    'load_blueprint': ('mason.io', 'load_blueprint'),
+    'load_blueprint_pb': ('mason.io', 'load_blueprint_pb'),
+    'load_blueprints': ('mason.io', 'load_blueprints'),
+    'load_config': ('mason.io', 'load_config'),
+    'save_blueprint': ('mason.io', 'save_blueprint'),
+    'save_blueprint_pb': ('mason.io', 'save_blueprint_pb'),
+    'save_blueprints': ('mason.io', 'save_blueprints'),
+}
 
 Blueprint = node.Blueprint
 Library = library.Library
@@ -21,11 +30,36 @@ Port = port.Port
 PortDirection = port.PortDirection
 Signal = callbacks.Signal
 
-dump_library = io.dump_library
 get_default_library = library.get_default_library
 inport = port.inport
-load_blueprint = io.load_blueprint
-load_config = io.load_config
 nodify = node.nodify
 outport = port.outport
 slot = callbacks.slot
+use_uvloop = node.use_uvloop
+
+
+@functools.lru_cache(maxsize=1)
+def _get_version() -> str:
+    """Returns the installed version of mason."""
+    # pylint: disable=import-outside-toplevel
+    try:
+        from importlib import metadata  # Python 3.8+
+    except ImportError:
+        import importlib_metadata as metadata  # Python 3.7<
+    return metadata.version('mason-framework')
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolves the version and serialization API (PEP 562)."""
+    if name == '__version__':
+        return _get_version()
+
+    try:
+        module_name, attr_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}') from None
+    module = importlib.import_module(module_name)
+    value = getattr(module, attr_name) if attr_name else module
+    globals()[name] = value
+    return value
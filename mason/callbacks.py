@@ -3,7 +3,7 @@
 import asyncio
 import inspect
 import types
-from typing import Any, Callable, Optional, Set, Union, TypeVar
+from typing import Any, Callable, Optional, Set, Tuple, Union, TypeVar
 import weakref
 
 CallbackType = Union[types.MethodType, Callable[..., Any]]
@@ -26,6 +26,8 @@ class Signal:
         self._annotations = annotations
         self._signature = inspect.Signature(params)
         self._slot_refs = set()
+        self._freeze_count = 0
+        self._frozen_slots: Optional[Tuple[CallbackType, ...]] = None
 
     def _cleanup_dead_refs(self) -> None:
         """Clean out dead references."""
@@ -84,6 +86,8 @@ class Signal:
             else:
                 ref = weakref.ref(func)
             self._slot_refs.add(ref)
+        if self._frozen_slots is not None:
+            self._frozen_slots = tuple(self._get_active_slots())
 
     def disconnect(self, *funcs: Optional[CallbackType]) -> None:
         """Removes the slot (if provided) or all slot connections."""
@@ -97,6 +101,8 @@ class Signal:
                 continue
             new_refs.add(ref)
         self._slot_refs = new_refs
+        if self._frozen_slots is not None:
+            self._frozen_slots = tuple(self._get_active_slots())
 
     async def emit(self, *args: Any) -> None:
         """Iterates over each active slot and calls them with the given values.
@@ -108,12 +114,38 @@ class Signal:
             TypeError if the provided arguments do not match the signature.
         """
         if self._signature.bind(*args):
-            tasks = (func(*args) for func in self._get_active_slots())
-            await asyncio.gather(*tasks)
+            slots = self._frozen_slots
+            if slots is None:
+                slots = self._get_active_slots()
+            if len(slots) == 1:
+                (func,) = slots
+                await func(*args)
+            elif slots:
+                tasks = (func(*args) for func in slots)
+                await asyncio.gather(*tasks)
+
+    def freeze(self) -> None:
+        """Holds the active slots so emit can skip weak reference checks.
+
+        While frozen, the slots are strongly referenced.  Connections made or
+        removed while frozen are still reflected.  Calls are counted, so each
+        freeze must be paired with an unfreeze.
+        """
+        if not self._freeze_count:
+            self._frozen_slots = tuple(self._get_active_slots())
+        self._freeze_count += 1
+
+    def unfreeze(self) -> None:
+        """Releases a freeze, returning to weak references after the last."""
+        self._freeze_count -= 1
+        if not self._freeze_count:
+            self._frozen_slots = None
 
     @property
     def is_empty(self) -> bool:
         """Cleans up dead references and returns if any active slots remain."""
+        if self._frozen_slots is not None:
+            return not self._frozen_slots
         self._cleanup_dead_refs()
         return not self._slot_refs
 
@@ -1,7 +1,9 @@
 """Command line interface for mason."""
 
 import importlib
+import importlib.util
 import os
+from typing import Dict
 
 import click
 import mason
@@ -10,12 +12,54 @@ _DEFAULT_CLI_PLUGS = {'mason_server.server'}
 _MASON_CLI_PLUGS = set(
     filter(bool, os.environ.get('MASON_CLI_PLUGS', '').split(',')))
 _MASON_CLI_PLUGS.update(_DEFAULT_CLI_PLUGS)
+_LOADED_CLI_PLUGS: Dict[str, bool] = {}
 
 
-@click.group()
+def _load_cli_plugs():
+    """Imports the command plugins so they can register their commands.
+
+    Each plugin is only attempted once per process; missing plugins are
+    detected through their module spec before importing.
+    """
+    for cli_plug in _MASON_CLI_PLUGS:
+        if cli_plug in _LOADED_CLI_PLUGS:
+            continue
+        try:
+            if importlib.util.find_spec(cli_plug) is None:
+                raise ModuleNotFoundError(f'No module named {cli_plug!r}',
+                                          name=cli_plug)
+            importlib.import_module(cli_plug)
+        except ImportError:
+            _LOADED_CLI_PLUGS[cli_plug] = False
+            if cli_plug not in _DEFAULT_CLI_PLUGS:
+                raise
+        else:
+            _LOADED_CLI_PLUGS[cli_plug] = True
+
+
+class _PluginGroup(click.Group):
+    """Command group that only loads the plugins when they are needed."""
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        """Returns a builtin command, or loads the plugins to find it."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            _load_cli_plugs()
+            command = super().get_command(ctx, cmd_name)
+        return command
+
+    def list_commands(self, ctx: click.Context):
+        """Loads the plugins before listing all of the commands."""
+        _load_cli_plugs()
+        return super().list_commands(ctx)
+
+
+@click.group(cls=_PluginGroup)
 @click.option('--config', help='Mason config file.', default='')
 def cli(config: str = None):
     """Mason command line interface."""
+    if os.environ.get('MASON_UVLOOP') == '1':
+        mason.use_uvloop()
     if config:
         mason.load_config(config)
 
@@ -24,12 +68,3 @@ def cli(config: str = None):
 def version():
     """Print out the current version."""
     print(mason.__version__)
-
-
-# Initialize command plugins
-for cli_plug in _MASON_CLI_PLUGS:
-    try:
-        module = importlib.import_module(cli_plug)
-    except ImportError:
-        if cli_plug not in _DEFAULT_CLI_PLUGS:
-            raise
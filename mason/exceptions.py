@@ -34,3 +34,7 @@ class InvalidConnectionError(MasonError):
 
     def __init__(self, a: 'port.Port', b: 'port.Port'):
         super().__init__(f'Cannot connect {a.name} to {b.name}.')
+
+
+class BlueprintFormatError(MasonError):
+    """Raised when a blueprint file is not in the expected format."""
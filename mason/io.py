@@ -1,12 +1,25 @@
 """Loaders for mason types."""
+import base64
+import collections
 import enum
 import functools
+import gzip
+import hashlib
 import json
-from typing import Any, Dict, Optional
+import os
+import stat
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, TypeVar, Union
 
+from google.protobuf import any_pb2
+from google.protobuf import descriptor_pb2
 from google.protobuf import json_format
+from google.protobuf import wrappers_pb2
+from google.protobuf.internal import decoder
+from google.protobuf.internal import encoder
 import yaml
 
+from mason import exceptions
 from mason import library as _lib
 from mason import node
 from mason import port
@@ -15,13 +28,279 @@ from mason.proto import config_pb2
 from mason.proto import blueprint_pb2
 from mason.proto import library_pb2
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def _read_content(filename: str) -> str:
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+_dump_yaml = functools.partial(yaml.dump,
+                               Dumper=_SafeDumper,
+                               default_flow_style=None,
+                               sort_keys=False)
+_load_yaml = functools.partial(yaml.load, Loader=_SafeLoader)
+_USE_JSON_FORMAT = os.environ.get('MASON_USE_JSON_FORMAT') == '1'
+_WRITE_YAML_AS_JSON = os.environ.get('MASON_WRITE_YAML_AS_JSON') == '1'
+
+_JSON_EXTENSIONS = ('.json',)
+_PROTO_EXTENSIONS = ('.pb', '.binpb')
+_BATCH_EXTENSIONS = ('.pbs',)
+_YAML_EXTENSIONS = ('.yaml', '.yml')
+
+_GZIP_MAGIC = b'\x1f\x8b'
+# Tag byte 0x0f has wire type 7, which is invalid, so no serialized
+# blueprint can start with this header.
+_BATCH_MAGIC = b'\x0fMBPS1'
+_STRING_VALUE_URL = ('type.googleapis.com/' +
+                     wrappers_pb2.StringValue.DESCRIPTOR.full_name)
+
+_INT_TYPES = frozenset([
+    descriptor_pb2.FieldDescriptorProto.TYPE_INT32,
+    descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    descriptor_pb2.FieldDescriptorProto.TYPE_UINT32,
+    descriptor_pb2.FieldDescriptorProto.TYPE_UINT64,
+    descriptor_pb2.FieldDescriptorProto.TYPE_SINT32,
+    descriptor_pb2.FieldDescriptorProto.TYPE_SINT64,
+    descriptor_pb2.FieldDescriptorProto.TYPE_FIXED32,
+    descriptor_pb2.FieldDescriptorProto.TYPE_FIXED64,
+    descriptor_pb2.FieldDescriptorProto.TYPE_SFIXED32,
+    descriptor_pb2.FieldDescriptorProto.TYPE_SFIXED64,
+])
+_FLOAT_TYPES = frozenset([
+    descriptor_pb2.FieldDescriptorProto.TYPE_FLOAT,
+    descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+])
+_FLOAT_NAMES = {'NaN': 'nan', 'Infinity': 'inf', '-Infinity': '-inf'}
+
+MessageType = TypeVar('MessageType')
+
+
+def _read_content(filename: str, mode: str = 'r') -> Union[str, bytes]:
     """Reads the content of a file."""
-    with open(filename, 'r') as f:
+    with open(filename, mode) as f:
         return f.read()
 
 
+def _get_file_mode(filename: str) -> int:
+    """Returns the permissions to write the file with.
+
+    Existing files keep their mode, and new files follow the umask as they
+    would with open().
+    """
+    try:
+        return stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_content(filename: str, content: Union[str, bytes]):
+    """Atomically writes the content of a file."""
+    mode = 'wb' if isinstance(content, bytes) else 'w'
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename),
+                                        suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(content)
+        # mkstemp creates the file as owner-only.
+        os.chmod(tmp_filename, _get_file_mode(filename))
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        os.remove(tmp_filename)
+        raise
+
+
+def _get_cache_filename(filename: str, cache_dir: str, extension: str) -> str:
+    """Returns the cache location for the given source file."""
+    key = hashlib.sha1(os.path.abspath(filename).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f'{key}{extension}')
+
+
+def _is_cache_current(cache_filename: str, filename: str) -> bool:
+    """Returns whether the cache file is at least as new as its source."""
+    try:
+        cache_mtime = os.stat(cache_filename).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return cache_mtime >= os.stat(filename).st_mtime_ns
+
+
+def _load_cached_yaml(filename: str, cache_dir: str) -> Dict[str, Any]:
+    """Loads YAML content, reusing the JSON cache while it is up to date."""
+    cache_filename = _get_cache_filename(filename, cache_dir, '.json')
+    if _is_cache_current(cache_filename, filename):
+        return json.loads(_read_content(cache_filename))
+
+    data = _load_yaml(_read_content(filename))
+    try:
+        content = orjson.dumps(data) if orjson else json.dumps(data)
+    except TypeError:
+        return data
+    # JSON has no dates and only string keys, so documents that would come
+    # back with different types are not cached.
+    if json.loads(content) != data:
+        return data
+    os.makedirs(cache_dir, exist_ok=True)
+    _write_content(cache_filename, content)
+    return data
+
+
+def _dump_json(data: Any) -> Union[str, bytes]:
+    """Dumps the data to indented JSON, using orjson when it is available."""
+    if orjson:
+        return orjson.dumps(data,
+                            default=_serialize,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, default=_serialize, indent=2, sort_keys=True)
+
+
+def _compact(**fields: Any) -> Dict[str, Any]:
+    """Returns the fields that are not set to their proto3 default."""
+    return {key: value for key, value in fields.items() if value}
+
+
+def _parse_well_known(data: Any, message: Any):
+    """Populates a well-known type message from its JSON representation.
+
+    Port values are stored as a StringValue packed into an Any, so that case
+    is packed directly instead of walking the value through json_format.
+    """
+    if not isinstance(data, dict):
+        raise json_format.ParseError(
+            f'Message type "{message.DESCRIPTOR.full_name}" must be a JSON '
+            f'object, got {data!r}.')
+    if (message.DESCRIPTOR is any_pb2.Any.DESCRIPTOR and
+            data.get('@type') == _STRING_VALUE_URL):
+        value = data.get('value', '')
+        if not isinstance(value, str):
+            raise json_format.ParseError(
+                f'Failed to parse value field: expected a string, got '
+                f'{value!r}.')
+        message.Pack(wrappers_pb2.StringValue(value=value))
+    else:
+        json_format.ParseDict(data, message)
+
+
+def _dump_well_known(message: Any) -> Any:
+    """Dumps a well-known type message to its JSON representation."""
+    if (message.DESCRIPTOR is any_pb2.Any.DESCRIPTOR and
+            message.type_url == _STRING_VALUE_URL):
+        value = wrappers_pb2.StringValue()
+        message.Unpack(value)
+        return {'@type': _STRING_VALUE_URL, 'value': value.value}
+    return dict(json_format.MessageToDict(message))
+
+
+def _convert_scalar(value: Any, field: Any) -> Any:
+    """Converts a JSON value for a scalar field the way json_format does."""
+    if field.type in _INT_TYPES:
+        if isinstance(value, bool):
+            raise json_format.ParseError(
+                f'Bool value {value} is not acceptable for integer field.')
+        if isinstance(value, float) and not value.is_integer():
+            raise json_format.ParseError(
+                f'Couldn\'t parse integer: {value}.')
+        if isinstance(value, str) and ' ' in value:
+            raise json_format.ParseError(
+                f'Couldn\'t parse integer: "{value}".')
+        return int(value)
+    if field.type in _FLOAT_TYPES:
+        return float(_FLOAT_NAMES.get(value, value))
+    if field.type == field.TYPE_ENUM and isinstance(value, str):
+        enum_value = field.enum_type.values_by_name.get(value)
+        if enum_value is None:
+            raise json_format.ParseError(
+                f'Invalid enum value {value} for enum type '
+                f'{field.enum_type.full_name}.')
+        return enum_value.number
+    if field.type == field.TYPE_BYTES and isinstance(value, str):
+        return base64.b64decode(value)
+    return value
+
+
+def _parse_message(data: Dict[str, Any],
+                   message: MessageType) -> MessageType:
+    """Populates the message from its JSON representation.
+
+    This walks the message descriptor directly rather than going through
+    json_format, which is kept as a fallback behind MASON_USE_JSON_FORMAT=1.
+    Well-known types such as google.protobuf.Any still use json_format.
+
+    Raises:
+        json_format.ParseError if the data contains an unknown field or a
+        value that cannot be converted to its field type.
+    """
+    if _USE_JSON_FORMAT:
+        return json_format.ParseDict(data, message)
+    descriptor = message.DESCRIPTOR
+    if not isinstance(data, dict):
+        raise json_format.ParseError(
+            f'Message type "{descriptor.full_name}" must be a JSON object, '
+            f'got {data!r}.')
+    for key, value in data.items():
+        field = (descriptor.fields_by_name.get(key) or
+                 descriptor.fields_by_camelcase_name.get(key))
+        if field is None:
+            raise json_format.ParseError(
+                f'Message type "{descriptor.full_name}" has no field named '
+                f'"{key}".')
+        if value is None:
+            continue
+
+        is_repeated = field.label == field.LABEL_REPEATED
+        if is_repeated and not isinstance(value, list):
+            raise json_format.ParseError(
+                f'Repeated field {key} must be in [] which is {value!r}.')
+        if field.message_type is None:
+            try:
+                if is_repeated:
+                    getattr(message, field.name).extend(
+                        _convert_scalar(item, field) for item in value)
+                else:
+                    setattr(message, field.name, _convert_scalar(value, field))
+            except (TypeError, ValueError) as e:
+                raise json_format.ParseError(
+                    f'Failed to parse {key} field: {e}.') from e
+        elif field.message_type.file.package == 'google.protobuf':
+            _parse_well_known(value, getattr(message, field.name))
+        elif is_repeated:
+            container = getattr(message, field.name)
+            for item in value:
+                _parse_message(item, container.add())
+        else:
+            _parse_message(value, getattr(message, field.name))
+    return message
+
+
+def _dump_message(message: Any) -> Dict[str, Any]:
+    """Dumps the set fields of the message to its JSON representation.
+
+    This is the inverse of _parse_message and keeps the proto field names.
+    """
+    if _USE_JSON_FORMAT:
+        return json_format.MessageToDict(message,
+                                         preserving_proto_field_name=True)
+    data = {}
+    for field, value in message.ListFields():
+        is_repeated = field.label == field.LABEL_REPEATED
+        if field.message_type is None:
+            data[field.name] = list(value) if is_repeated else value
+        elif field.message_type.file.package == 'google.protobuf':
+            data[field.name] = _dump_well_known(value)
+        elif is_repeated:
+            data[field.name] = [_dump_message(item) for item in value]
+        else:
+            data[field.name] = _dump_message(value)
+    return data
+
+
 def _serialize(value: Any) -> Any:
     """Serializes the value for JSON."""
     if isinstance(value, enum.Enum):
@@ -29,95 +308,254 @@ def _serialize(value: Any) -> Any:
     return str(value)
 
 
+_encode_json = json.JSONEncoder(default=_serialize).encode
+
+
+def _load_port_value(config: blueprint_pb2.Port) -> Any:
+    """Return the port value stored in the config."""
+    value = wrappers_pb2.StringValue()
+    config.value.Unpack(value)
+    return json.loads(value.value)
+
+
 def _create_node(config: blueprint_pb2.Node,
                  parent: node.Node) -> node.Node:
-    """Return new node from config."""
-    new_node = parent.create(config.type,
-                             uid=config.uid,
-                             name=config.name,
-                             title=config.title)
-    for node_config in config.nodes:
-        _create_node(node_config, new_node)
-    return new_node
+    """Return new node from config, creating its children iteratively."""
+    root_node = None
+    queue = collections.deque([(config, parent)])
+    while queue:
+        node_config, node_parent = queue.popleft()
+        props = {}
+        if node_config.ports:
+            props['values'] = {
+                port_config.name: _load_port_value(port_config)
+                for port_config in node_config.ports
+            }
+        new_node = node_parent.create(node_config.type,
+                                      uid=node_config.uid,
+                                      name=node_config.name,
+                                      title=node_config.title,
+                                      **props)
+        if root_node is None:
+            root_node = new_node
+        queue.extend((child_config, new_node)
+                     for child_config in node_config.nodes)
+    return root_node
 
 
 def _create_blueprint(config: blueprint_pb2.Blueprint,
                       library: _lib.Library) -> node.Blueprint:
     """Return new blueprint from config."""
     bp_type = library.blueprint_types.get(config.type, node.Blueprint)
-    bp = bp_type(name=config.name, library=library)
+    bp = bp_type(uid=config.uid,
+                 name=config.name,
+                 title=config.title,
+                 library=library)
     for node_config in config.nodes:
         _create_node(node_config, bp)
+    endpoints = {}
     for connection in config.connections:
-        bp.connect(connection.source, connection.target)
+        source = endpoints.get(connection.source)
+        if source is None:
+            source = endpoints[connection.source] = bp[connection.source]
+        target = endpoints.get(connection.target)
+        if target is None:
+            target = endpoints[connection.target] = bp[connection.target]
+        bp.connect(source, target)
     return bp
 
 
+def _join_path(path: str, name: str) -> str:
+    """Returns the name joined to the hierarchy path."""
+    return f'{path}.{name}' if path else name
+
+
+def _dump_node_config(node_inst: node.Node,
+                      config: blueprint_pb2.Node) -> blueprint_pb2.Node:
+    """Dumps node instance, without its children, to config."""
+    # pylint: disable=protected-access
+    config.uid = node_inst.uid
+    config.name = node_inst.name
+    config.title = node_inst._title
+    config.type = type(node_inst).__schema__.uid
+    # pylint: enable=protected-access
+    input_direction = port.PortDirection.Input
+    for port_name, port_inst in node_inst.ports.items():
+        if (port_inst.direction == input_direction and
+                not port_inst.is_connected and
+                port_inst.local_value != port_inst.default):
+            value = wrappers_pb2.StringValue(
+                value=_encode_json(port_inst.local_value))
+            config.ports.add(name=port_name).value.Pack(value)
+    return config
+
+
+def _dump_blueprint_config(bp: node.Blueprint) -> blueprint_pb2.Blueprint:
+    """Dumps blueprint instance to config.
+
+    The hierarchy is traversed once to dump the nodes and to record the path
+    of every port and slot, then the connections are resolved to those paths.
+    """
+    # pylint: disable=protected-access
+    config = blueprint_pb2.Blueprint(uid=bp.uid,
+                                     name=bp.name,
+                                     title=bp._title,
+                                     type=type(bp).__schema__.uid)
+    hierarchy = []
+    port_paths = {}
+    slot_paths = {}
+    queue = collections.deque([('', bp, config.nodes)])
+    while queue:
+        path, node_inst, nodes_config = queue.popleft()
+        hierarchy.append((path, node_inst))
+        for port_name, port_inst in node_inst.ports.items():
+            port_paths[port_inst] = _join_path(path, port_name)
+        for slot_name, slot_func in node_inst.slots.items():
+            slot_paths[slot_func] = _join_path(path, slot_name)
+        for child in node_inst._nodes.values():
+            child_config = _dump_node_config(child, nodes_config.add())
+            queue.append((_join_path(path, child.name),
+                          child,
+                          child_config.nodes))
+
+    output_direction = port.PortDirection.Output
+    add_connection = config.connections.add
+    for path, node_inst in hierarchy:
+        for port_name, port_inst in node_inst.ports.items():
+            if port_inst.direction != output_direction:
+                continue
+            for other in port_inst._connections:
+                if other in port_paths:
+                    add_connection(source=_join_path(path, port_name),
+                                   target=port_paths[other])
+        for signal_name, signal in node_inst.signals.items():
+            for slot_func in signal._get_active_slots():
+                if slot_func in slot_paths:
+                    add_connection(source=_join_path(path, signal_name),
+                                   target=slot_paths[slot_func])
+    # pylint: enable=protected-access
+    return config
+
+
 def _dump_port_schema(port_schema: port.Port) -> Dict[str, Any]:
     """Dumps port schema to config."""
     if port_schema.default is not None:
-        default = json.dumps(port_schema.default, default=_serialize)
+        default = _encode_json(port_schema.default)
     else:
         default = None
-    port_config = library_pb2.Port(name=port_schema.name,
-                                   type=port_schema.value_type,
-                                   direction=port_schema.direction.value,
-                                   sequence=port_schema.is_sequence,
-                                   map=port_schema.is_map,
-                                   choices=port_schema.choices,
-                                   default=default)
-    return json_format.MessageToDict(port_config)
+    if _USE_JSON_FORMAT:
+        port_config = library_pb2.Port(name=port_schema.name,
+                                       type=port_schema.value_type,
+                                       direction=port_schema.direction.value,
+                                       sequence=port_schema.is_sequence,
+                                       map=port_schema.is_map,
+                                       choices=port_schema.choices,
+                                       default=default)
+        return json_format.MessageToDict(port_config)
+    choices = port_schema.choices
+    return _compact(name=port_schema.name,
+                    type=port_schema.value_type,
+                    direction=port_schema.direction.value,
+                    sequence=port_schema.is_sequence,
+                    map=port_schema.is_map,
+                    choices=list(choices) if choices else None,
+                    default=default)
 
 
 def _dump_node_schema(node_schema: schema.Schema) -> Dict[str, Any]:
     """Dumps node schema to config."""
     ports = []
-    for _, port_schema in sorted(node_schema.ports.items()):
+    for _, port_schema in node_schema.sorted_ports:
         ports.append(_dump_port_schema(port_schema))
-    node_config = library_pb2.Node(name=node_schema.name,
-                                   group=node_schema.group,
-                                   ports=ports,
-                                   signals=list(sorted(node_schema.signals)),
-                                   slots=list(sorted(node_schema.slots)))
-    return json_format.MessageToDict(node_config)
+    if _USE_JSON_FORMAT:
+        node_config = library_pb2.Node(
+            name=node_schema.name,
+            group=node_schema.group,
+            ports=ports,
+            signals=node_schema.sorted_signals,
+            slots=node_schema.sorted_slots)
+        return json_format.MessageToDict(node_config)
+    return _compact(group=node_schema.group,
+                    name=node_schema.name,
+                    ports=ports,
+                    signals=list(node_schema.sorted_signals),
+                    slots=list(node_schema.sorted_slots))
 
 
 def _dump_blueprint_schema(bp_schema: schema.Schema) -> Dict[str, Any]:
     """Dumps the blueprint to config."""
-    bp_config = library_pb2.Blueprint(group=bp_schema.group,
-                                      name=bp_schema.name,
-                                      signals=list(sorted(bp_schema.signals)),
-                                      slots=list(sorted(bp_schema.slots)))
-    return json_format.MessageToDict(bp_config)
+    if _USE_JSON_FORMAT:
+        bp_config = library_pb2.Blueprint(
+            group=bp_schema.group,
+            name=bp_schema.name,
+            signals=bp_schema.sorted_signals,
+            slots=bp_schema.sorted_slots)
+        return json_format.MessageToDict(bp_config)
+    return _compact(group=bp_schema.group,
+                    name=bp_schema.name,
+                    signals=list(bp_schema.sorted_signals),
+                    slots=list(bp_schema.sorted_slots))
 
 
-def _load_data(filename: str) -> Dict[str, Any]:
-    """Loads content from a file."""
-    content = _read_content(filename)
-    if filename.endswith('.yaml') or filename.endswith('.yml'):
-        return yaml.safe_load(content)
-    if filename.endswith('json'):
-        return json.loads(content)
+def _read_data(filename: str) -> Dict[str, Any]:
+    """Reads and parses content from a file."""
+    if filename.endswith(_YAML_EXTENSIONS):
+        return _load_yaml(_read_content(filename))
+    if filename.endswith(_JSON_EXTENSIONS):
+        return json.loads(_read_content(filename))
     raise RuntimeError(f'Unknown file format: {filename}.')
 
 
+def _write_data(filename: str, data: Dict[str, Any]):
+    """Writes content to a file.
+
+    YAML files are written as JSON, which is also valid YAML, when the
+    MASON_WRITE_YAML_AS_JSON environment variable is set to 1.
+    """
+    if filename.endswith(_YAML_EXTENSIONS) and not _WRITE_YAML_AS_JSON:
+        _write_content(filename, _dump_yaml(data))
+    elif filename.endswith(_YAML_EXTENSIONS + _JSON_EXTENSIONS):
+        _write_content(filename, _dump_json(data))
+    else:
+        raise RuntimeError(f'Unknown file format: {filename}.')
+
+
+def _load_data(filename: str) -> Dict[str, Any]:
+    """Loads content from a file.
+
+    When the MASON_CACHE_DIR environment variable is set, parsed YAML files
+    are cached there as JSON and reused until the source file is modified.
+    """
+    cache_dir = os.environ.get('MASON_CACHE_DIR')
+    if cache_dir and filename.endswith(_YAML_EXTENSIONS):
+        return _load_cached_yaml(filename, cache_dir)
+    return _read_data(filename)
+
+
+def dump_blueprint(bp: node.Blueprint) -> Dict[str, Any]:
+    """Dumps blueprint instance to configuration."""
+    return _dump_message(_dump_blueprint_config(bp))
+
+
 def dump_library(library: Optional[_lib.Library] = None) -> Dict[str, Any]:
     """Dumps library instance to configuration."""
     library = library or _lib.get_default_library()
-    config = library_pb2.Library()
+    node_types, blueprint_types = library.sorted_types()
     nodes = [_dump_node_schema(node_type.__schema__)
-             for _, node_type in sorted(library.node_types.items())]
+             for _, node_type in node_types]
 
     blueprints = [_dump_blueprint_schema(bp_type.__schema__)
-                  for _, bp_type in sorted(library.blueprint_types.items())]
-    config = library_pb2.Library(nodes=nodes, blueprints=blueprints)
-    return json_format.MessageToDict(config)
+                  for _, bp_type in blueprint_types]
+    if _USE_JSON_FORMAT:
+        config = library_pb2.Library(nodes=nodes, blueprints=blueprints)
+        return json_format.MessageToDict(config)
+    return _compact(nodes=nodes, blueprints=blueprints)
 
 
 def load_config(filename: str):
     """Loads a configuration file for mason."""
     data = _load_data(filename)
-    conf = json_format.ParseDict(data, config_pb2.Config())
+    conf = _parse_message(data, config_pb2.Config())
     # pylint: disable=no-member
     modules = set(conf.library.modules)
     if conf.library.extends_default:
@@ -128,10 +566,116 @@ def load_config(filename: str):
     # pylint: enable=no-member
 
 
+@functools.lru_cache(maxsize=128)
+def _load_blueprint_config(filename: str, mtime: int) -> bytes:
+    """Loads a blueprint config from disk in its serialized form.
+
+    The modification time is only used as part of the cache key so that
+    edited files are parsed again.  When the MASON_CACHE_DIR environment
+    variable is set, YAML and JSON blueprints are also cached there in the
+    binary protobuf format.
+    """
+    del mtime  # Unused.
+    if filename.endswith(_BATCH_EXTENSIONS):
+        raise exceptions.BlueprintFormatError(
+            f'{filename} holds multiple blueprints, use load_blueprints.')
+    if filename.endswith(_PROTO_EXTENSIONS):
+        return _check_single_blueprint(filename, _read_content(filename, 'rb'))
+
+    cache_dir = os.environ.get('MASON_CACHE_DIR')
+    if cache_dir:
+        cache_filename = _get_cache_filename(filename, cache_dir, '.pb')
+        if _is_cache_current(cache_filename, filename):
+            return _read_content(cache_filename, 'rb')
+
+    data = _read_data(filename)
+    bp_config = _parse_message(data, blueprint_pb2.Blueprint())
+    content = bp_config.SerializeToString()
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_content(cache_filename, content)
+    return content
+
+
+def _check_single_blueprint(filename: str, content: bytes) -> bytes:
+    """Returns the content, rejecting files written by save_blueprints."""
+    if content.startswith((_BATCH_MAGIC, _GZIP_MAGIC)):
+        raise exceptions.BlueprintFormatError(
+            f'{filename} holds multiple blueprints, use load_blueprints.')
+    return content
+
+
 def load_blueprint(
         filename: str,
         library: Optional[_lib.Library] = None) -> node.Blueprint:
     """Loads a blueprint file from disk."""
-    data = _load_data(filename)
-    bp_config = json_format.ParseDict(data, blueprint_pb2.Blueprint())
+    filename = os.path.abspath(filename)
+    content = _load_blueprint_config(filename, os.stat(filename).st_mtime_ns)
+    bp_config = blueprint_pb2.Blueprint.FromString(content)
+    return _create_blueprint(bp_config, library or _lib.get_default_library())
+
+
+def load_blueprints(
+        filename: str,
+        library: Optional[_lib.Library] = None) -> List[node.Blueprint]:
+    """Loads the blueprints stored in a file by save_blueprints."""
+    # pylint: disable=protected-access
+    content = _read_content(filename, 'rb')
+    if content[:2] == _GZIP_MAGIC:
+        content = gzip.decompress(content)
+    if not content.startswith(_BATCH_MAGIC):
+        raise exceptions.BlueprintFormatError(
+            f'{filename} was not written by save_blueprints.')
+    library = library or _lib.get_default_library()
+    blueprints = []
+    pos = len(_BATCH_MAGIC)
+    while pos < len(content):
+        size, pos = decoder._DecodeVarint32(content, pos)
+        bp_config = blueprint_pb2.Blueprint.FromString(content[pos:pos + size])
+        blueprints.append(_create_blueprint(bp_config, library))
+        pos += size
+    return blueprints
+
+
+def load_blueprint_pb(
+        filename: str,
+        library: Optional[_lib.Library] = None) -> node.Blueprint:
+    """Loads a binary protobuf blueprint file from disk."""
+    content = _check_single_blueprint(filename, _read_content(filename, 'rb'))
+    bp_config = blueprint_pb2.Blueprint.FromString(content)
     return _create_blueprint(bp_config, library or _lib.get_default_library())
+
+
+def save_blueprint(filename: str, bp: node.Blueprint):
+    """Saves a blueprint to disk in the format of its file extension."""
+    if filename.endswith(_PROTO_EXTENSIONS):
+        save_blueprint_pb(filename, bp)
+    else:
+        _write_data(filename, dump_blueprint(bp))
+
+
+def save_blueprint_pb(filename: str, bp: node.Blueprint):
+    """Saves a blueprint to disk as a binary protobuf file."""
+    _write_content(filename, _dump_blueprint_config(bp).SerializeToString())
+
+
+def save_blueprints(filename: str,
+                    blueprints: Sequence[node.Blueprint],
+                    compress: bool = False):
+    """Saves blueprints to a single file of length-delimited protobufs.
+
+    The file starts with a header that load_blueprint rejects, followed by
+    each blueprint as its varint encoded size and its binary protobuf
+    encoding.  When compress is set, the content is gzipped with a low
+    compression level.  The .pbs extension is used for these files.
+    """
+    # pylint: disable=protected-access
+    records = [_BATCH_MAGIC]
+    for bp in blueprints:
+        content = _dump_blueprint_config(bp).SerializeToString()
+        records.append(encoder._VarintBytes(len(content)))
+        records.append(content)
+    content = b''.join(records)
+    if compress:
+        content = gzip.compress(content, compresslevel=1)
+    _write_content(filename, content)
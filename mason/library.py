@@ -2,7 +2,7 @@
 import importlib
 import functools
 import types
-from typing import Any, Dict, Sequence, Union, Type
+from typing import Any, Dict, Optional, Sequence, Tuple, Union, Type
 
 from mason import node
 
@@ -24,6 +24,8 @@ class Library:
         self.version = version
         self.blueprint_types: Dict[str, Type[node.Blueprint]] = {}
         self.node_types: Dict[str, Type[node.Node]] = {}
+        self._revision = 0
+        self._sorted_types: Optional[Tuple[Any, ...]] = None
         if modules:
             for module in modules:
                 self.load(module)
@@ -36,6 +38,7 @@ class Library:
 
     def load_scope(self, items: Dict[str, Any]):
         """Loads nodes and blueprints from a dictionary."""
+        self._revision += 1
         for item in items.values():
             if hasattr(item, '__node__'):
                 item = getattr(item, '__node__')
@@ -54,6 +57,7 @@ class Library:
 
     def register(self, item_type: Type[node.Node]):
         """Register node or blueprint type to this library."""
+        self._revision += 1
         if issubclass(item_type, node.Blueprint):
             self.blueprint_types[item_type.__schema__.uid] = item_type
         elif issubclass(item_type, node.Node):
@@ -61,6 +65,21 @@ class Library:
         else:
             raise TypeError(f'Invalid type to register: {item_type}.')
 
+    def sorted_types(self) -> Tuple[Tuple[Tuple[str, Type[node.Node]], ...],
+                                    Tuple[Tuple[str, Type[node.Blueprint]],
+                                          ...]]:
+        """Returns the node and blueprint types sorted by their uid.
+
+        The result is cached until more types are loaded or registered.
+        """
+        # Lengths also catch types that were added to the dicts directly.
+        key = (self._revision, len(self.node_types), len(self.blueprint_types))
+        if self._sorted_types is None or self._sorted_types[0] != key:
+            self._sorted_types = (key,
+                                  tuple(sorted(self.node_types.items())),
+                                  tuple(sorted(self.blueprint_types.items())))
+        return self._sorted_types[1], self._sorted_types[2]
+
 
 DefaultLibrary = functools.partial(Library, modules=DEFAULT_MODULES)
 
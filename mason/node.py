@@ -1,9 +1,11 @@
 """Defines Node classes."""
 import asyncio
 import contextlib
+import functools
 import inspect
+import sys
 import uuid
-from typing import Any, Callable, Dict, Optional, Set, Sequence, TypeVar, Union
+from typing import Any, Callable, Dict, Optional, Sequence, TypeVar, Union
 from typing import Generator, Tuple, Type, TYPE_CHECKING
 
 import attr
@@ -26,6 +28,15 @@ class ExecutionContext:
     results: Dict[str, Any] = None
 
 
+_EAGER_TASK_FACTORY = getattr(asyncio, 'eager_task_factory', None)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Splits a hierarchy path into its interned parts."""
+    return tuple(sys.intern(part) for part in path.split('.'))
+
+
 class NodeMeta(type):
     """Metaclass for nodes to handle port creation and registration."""
 
@@ -58,15 +69,17 @@ class Node(metaclass=NodeMeta):
             raise NotImplementedError(f'{type(self).__name__} is abstract.')
 
         self.name = name
-        self.uid = uid or str(uuid.uuid4())
+        self.uid = uid or uuid.uuid4().hex
         self.ports: Dict[str, port.Port] = {}
         self.signals: Dict[str, callbacks.Signal] = {}
 
         self._library = library
+        self._resolved_library: Optional['library.Library'] = None
         self._title = title
         self._parent: Optional['Node'] = None
-        self._nodes: Set['Node'] = set()
+        self._nodes: Dict[int, 'Node'] = {}
         self._execution_context: Optional[ExecutionContext] = None
+        self._ctx: Optional[ExecutionContext] = None
 
         self._init_schema(type(self).__schema__, values or {})
 
@@ -86,7 +99,7 @@ class Node(metaclass=NodeMeta):
                                              callbacks.Signal,
                                              Callable[..., Any]]:
         """Returns an item within the hierarchy."""
-        parts = key.split('.')
+        parts = _split_path(key)
         curr = self
         for part in parts[:-1]:
             if part == '__self__':
@@ -102,9 +115,9 @@ class Node(metaclass=NodeMeta):
         slots = curr.slots
         if prop in slots:
             return slots[prop]
-        nodes = curr.nodes
-        if prop in nodes:
-            return nodes[prop]
+        child = curr.find_child(prop)
+        if child:
+            return child
         raise KeyError(key)
 
     def _init_schema(self,
@@ -122,10 +135,17 @@ class Node(metaclass=NodeMeta):
             for signal_name in my_schema.signals:
                 self.signals[signal_name] = callbacks.Signal()
 
-    def connect(self, source_path: str, target_path: str):
-        """Convenience method to create a connection between the children."""
-        source = self[source_path]
-        target = self[target_path]
+    def connect(self, source: Union[str, port.Port, callbacks.Signal],
+                target: Union[str, port.Port, Callable[..., Any]]):
+        """Convenience method to create a connection between the children.
+
+        Either end may be given as a hierarchy path or as an already resolved
+        port, signal or slot.
+        """
+        if isinstance(source, str):
+            source = self[source]
+        if isinstance(target, str):
+            target = self[target]
         source.connect(target)
 
     def create(self, node_type: Union[str, Type['Node']], **props) -> 'Node':
@@ -161,13 +181,35 @@ class Node(metaclass=NodeMeta):
             self._execution_context = None
 
     async def emit(self, signal_name: str, *args: Any) -> None:
-        """Helper function to emit a signal by name."""
-        await self.signals[signal_name].emit(*args)
+        """Helper function to emit a signal by name, if it has any slots."""
+        signal = self.signals[signal_name]
+        if not signal.is_empty:
+            await signal.emit(*args)
 
     async def gather(self, *names: str) -> Sequence[Any]:
-        """Gathers multiple port values."""
-        tasks = (self.ports[name].get() for name in names)
-        return await asyncio.gather(*tasks)
+        """Gathers multiple port values.
+
+        Unconnected ports without a getter are read directly, and a single
+        remaining port is awaited without scheduling a task.
+        """
+        ports = self.ports
+        values = []
+        pending = []
+        for index, name in enumerate(names):
+            port_inst = ports[name]
+            if port_inst.is_connected or port_inst.getter:
+                pending.append(index)
+                values.append(port_inst.get())
+            else:
+                values.append(port_inst.local_value)
+        if len(pending) == 1:
+            index = pending[0]
+            values[index] = await values[index]
+        elif pending:
+            results = await asyncio.gather(*(values[i] for i in pending))
+            for index, result in zip(pending, results):
+                values[index] = result
+        return values
 
     def generate_unique_name(self, node_type: Type['Node']) -> str:
         """Returns a unique name for a given base in this container."""
@@ -187,7 +229,11 @@ class Node(metaclass=NodeMeta):
 
     def get_context(self) -> Optional[ExecutionContext]:
         """Returns the context for this node."""
-        curr = self
+        if self._execution_context:
+            return self._execution_context
+        if self._ctx:
+            return self._ctx
+        curr = self._parent
         # pylint: disable=protected-access
         while curr:
             if curr._execution_context:
@@ -209,7 +255,7 @@ class Node(metaclass=NodeMeta):
             recursive: bool = False,
             node_type: Optional[Type['Node']] = None) -> Optional['Node']:
         """Returns a child by its name."""
-        for child in self._nodes:
+        for child in self._nodes.values():
             if ((not node_type or isinstance(child, node_type)) and
                     child.name == name):
                 return child
@@ -222,7 +268,13 @@ class Node(metaclass=NodeMeta):
 
     @property
     def library(self) -> 'library.Library':
-        """Traverse up the hierarchy to find the closest library."""
+        """Traverse up the hierarchy to find the closest library.
+
+        The resolved library is cached until this node, or one of its
+        ancestors, is moved to a new parent.
+        """
+        if self._resolved_library is not None:
+            return self._resolved_library
         curr = self
         # pylint: disable=protected-access
         while curr and not curr._library:
@@ -230,7 +282,7 @@ class Node(metaclass=NodeMeta):
         if not curr:
             from mason import library as _lib  # pylint: disable=import-outside-toplevel
             return _lib.get_default_library()
-        # pylint: disable=protected-access
+        self._resolved_library = curr._library
         return curr._library
 
     @property
@@ -254,18 +306,26 @@ class Node(metaclass=NodeMeta):
     @property
     def nodes(self) -> Dict[str, 'Node']:
         """Returns the children for this node."""
-        return {n.name: n for n in self._nodes}
+        return {n.name: n for n in self._nodes.values()}
 
     @parent.setter
     def parent(self, parent: Optional['Node']):
         """Sets the parent for this node."""
         if parent == self._parent:
             return
+        # pylint: disable=protected-access
         if self._parent:
-            self._parent._nodes.remove(self)  # pylint: disable=protected-access
+            del self._parent._nodes[id(self)]
         self._parent = parent
         if parent:
-            parent._nodes.add(self)  # pylint: disable=protected-access
+            parent._nodes[id(self)] = self
+        stack = [self] if not self._library else []
+        while stack:
+            node = stack.pop()
+            node._resolved_library = None
+            stack.extend(child for child in node._nodes.values()
+                         if not child._library)
+        # pylint: enable=protected-access
 
     async def setup(self):
         """Setup this node before execution."""
@@ -291,7 +351,7 @@ class Node(metaclass=NodeMeta):
 
     def walk_nodes(self) -> Generator['Node', None, None]:
         """Traverses the hierarchy of this node."""
-        for node in self._nodes:
+        for node in self._nodes.values():
             yield node
             yield from node.walk_nodes()
 
@@ -304,27 +364,102 @@ class Blueprint(Node):
 
     triggered: callbacks.Signal
 
+    # Class level default so nodes built through nodify, which bypasses this
+    # __init__, still run normally.
+    eager = False
+
+    def __init__(self, *, eager: bool = False, **props):
+        """Initializes the blueprint.
+
+        When eager is set and the interpreter supports it, the running loop
+        uses asyncio's eager task factory for the duration of each run, so
+        slots that finish without suspending never allocate a scheduled
+        task.  The previous factory is restored when the run ends.
+        """
+        super().__init__(**props)
+        self.eager = eager
+
     async def __call__(self,
                        initial_state: Dict[str, Any] = None,
                        **args: Any) -> Any:
         """Executes the blueprint."""
+        loop = asyncio.get_running_loop()
+        task_factory = loop.get_task_factory()
+        use_eager = (self.eager and _EAGER_TASK_FACTORY is not None and
+                     task_factory is None)
+        if use_eager:
+            loop.set_task_factory(_EAGER_TASK_FACTORY)
+        signals = [signal
+                   for node in (self, *self.walk_nodes())
+                   for signal in node.signals.values()]
+        for signal in signals:
+            signal.freeze()
+        try:
+            return await self._run(initial_state, args)
+        finally:
+            for signal in signals:
+                signal.unfreeze()
+            if use_eager:
+                loop.set_task_factory(task_factory)
+
+    async def _run(self,
+                   initial_state: Optional[Dict[str, Any]],
+                   args: Dict[str, Any]) -> Any:
+        """Runs the blueprint within a new execution context."""
         with self.execution_context(initial_state, args) as context:
-            for node in self.walk_nodes():
-                await node.setup()
+            bound = self._bind_context(context)
             try:
-                await self.emit('triggered')
-            except exceptions.ReturnException as exc:
-                results = exc.value or context.results
-            except exceptions.ExitException as exc:
-                if exc.code != 0:
-                    raise
-            else:
-                results = context.results
-            finally:
                 for node in self.walk_nodes():
-                    await node.teardown()
+                    await node.setup()
+                try:
+                    await self.emit('triggered')
+                except exceptions.ReturnException as exc:
+                    results = exc.value or context.results
+                except exceptions.ExitException as exc:
+                    if exc.code != 0:
+                        raise
+                else:
+                    results = context.results
+                finally:
+                    for node in self.walk_nodes():
+                        await node.teardown()
+            finally:
+                for node in bound:
+                    node._ctx = None  # pylint: disable=protected-access
             return results if results else None
 
+    def _bind_context(self, context: ExecutionContext) -> Sequence[Node]:
+        """Points descendants at the context so lookups skip the parent walk.
+
+        Nested blueprints and their children are left alone, since they
+        resolve to their own context while running.
+        """
+        # pylint: disable=protected-access
+        bound = []
+        stack = list(self._nodes.values())
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Blueprint):
+                continue
+            node._ctx = context
+            bound.append(node)
+            stack.extend(node._nodes.values())
+        return bound
+
+
+def use_uvloop() -> bool:
+    """Installs the uvloop event loop policy when uvloop is available.
+
+    The policy only applies to event loops created afterwards, so this should
+    be called before the loop that runs the blueprints is started.
+    """
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 def nodify(*args,
            name: str = '',
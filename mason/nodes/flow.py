@@ -58,18 +58,20 @@ class For(mason.Node):
     def __init__(self, **props):
         super().__init__(**props)
 
-        self._cancelled = asyncio.Event()
+        self._cancelled = False
 
     @mason.slot
     async def run(self):
         """Implement internal run function."""
-        self._cancelled.clear()
+        self._cancelled = False
         start, stop, interval = await self.gather('start', 'stop', 'interval')
+        index_port = self.ports['index']
+        emit = self.emit
         for i in range(start, stop, interval):
-            self.ports['index'].local_value = i
-            await self.emit('index_changed')
-            if self._cancelled.is_set():
-                await self.emit('cancelled')
+            index_port.local_value = i
+            await emit('index_changed')
+            if self._cancelled:
+                await emit('cancelled')
                 break
         else:
             await self.emit('finished')
@@ -77,7 +79,7 @@ class For(mason.Node):
     @mason.slot
     async def cancel(self):
         """Cancels the loop."""
-        self._cancelled.set()
+        self._cancelled = True
 
 
 class Iterate(mason.Node):
@@ -92,18 +94,20 @@ class Iterate(mason.Node):
 
     def __init__(self, **props):
         super().__init__(**props)
-        self._cancelled = asyncio.Event()
+        self._cancelled = False
 
     @mason.slot
     async def run(self):
         """Implement internal iteration logic."""
-        self._cancelled.clear()
+        self._cancelled = False
         items = await self.get('items')
+        item_port = self.ports['item']
+        emit = self.emit
         for item in items:
-            self.ports['item'].local_value = item
-            await self.emit('item_changed')
-            if self._cancelled.is_set():
-                await self.emit('cancelled')
+            item_port.local_value = item
+            await emit('item_changed')
+            if self._cancelled:
+                await emit('cancelled')
                 break
         else:
             await self.emit('finished')
@@ -122,19 +126,22 @@ class Enumerate(mason.Node):
 
     def __init__(self, **props):
         super().__init__(**props)
-        self._cancelled = asyncio.Event()
+        self._cancelled = False
 
     @mason.slot
     async def run(self):
         """Implement internal iteration logic."""
-        self._cancelled.clear()
+        self._cancelled = False
         items = await self.get('items')
+        index_port = self.ports['index']
+        item_port = self.ports['item']
+        emit = self.emit
         for index, item in enumerate(items):
-            self.ports['index'].local_value = index
-            self.ports['item'].local_value = item
-            await self.emit('item_changed')
-            if self._cancelled.is_set():
-                await self.emit('cancelled')
+            index_port.local_value = index
+            item_port.local_value = item
+            await emit('item_changed')
+            if self._cancelled:
+                await emit('cancelled')
                 break
         else:
             await self.emit('finished')
@@ -174,15 +181,15 @@ class While(mason.Node):
     def __init__(self, **props):
         super().__init__(**props)
 
-        self._cancelled = asyncio.Event()
+        self._cancelled = False
 
     @mason.slot
     async def run(self):
         """Perform while loop."""
-        self._cancelled.clear()
+        self._cancelled = False
         while await self.get('condition'):
             await self.emit('triggered')
-            if self._cancelled.is_set():
+            if self._cancelled:
                 await self.emit('cancelled')
                 break
         else:
@@ -191,7 +198,7 @@ class While(mason.Node):
     @mason.slot
     async def cancel(self):
         """Cancels the while loop."""
-        self._cancelled.set()
+        self._cancelled = True
 
 
 class If(mason.Node):
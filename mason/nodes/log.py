@@ -1,10 +1,22 @@
 """Define logging nodes."""
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 import mason
 
 
+_LEVELS = {
+    'CRITICAL': logging.CRITICAL,
+    'FATAL': logging.FATAL,
+    'ERROR': logging.ERROR,
+    'WARN': logging.WARNING,
+    'WARNING': logging.WARNING,
+    'INFO': logging.INFO,
+    'DEBUG': logging.DEBUG,
+    'NOTSET': logging.NOTSET,
+}
+
+
 class Print(mason.Node):
     """Prints out a message."""
 
@@ -23,10 +35,45 @@ class Log(mason.Node):
     level: str = 'INFO'
     message: Any = None
 
+    def __init__(self, **props):
+        super().__init__(**props)
+        self._resolved: Optional[Tuple[logging.Logger, int]] = None
+
+    async def setup(self):
+        """Resolves the logger and level up front when they are constant.
+
+        An invalid level is left unresolved so that it only raises when the
+        node logs.
+        """
+        name_port = self.ports['name']
+        level_port = self.ports['level']
+        self._resolved = None
+        if not (name_port.is_connected or level_port.is_connected):
+            log_level = _LEVELS.get(str(level_port.local_value).upper())
+            if log_level is not None:
+                self._resolved = (logging.getLogger(name_port.local_value),
+                                  log_level)
+
+    async def teardown(self):
+        """Clears the resolved logger and level."""
+        self._resolved = None
+
+    def _get_level(self, level: str) -> int:
+        """Returns the logging level for the name."""
+        try:
+            return _LEVELS[str(level).upper()]
+        except KeyError:
+            raise ValueError(
+                f'Invalid log level {level!r} for node {self.name}.') from None
+
     @mason.slot
     async def log(self):
         """Logs to the logger."""
-        name, level, message = await self.gather('name', 'level', 'message')
-        log_level = getattr(logging, level)
-        logger = logging.getLogger(name)
-        logger.log(log_level, message)
+        if self._resolved:
+            logger, log_level = self._resolved
+        else:
+            name, level = await self.gather('name', 'level')
+            log_level = self._get_level(level)
+            logger = logging.getLogger(name)
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, await self.get('message'))
@@ -1,7 +1,8 @@
 """Defines model schema files."""
 import inspect
+import sys
 import typing
-from typing import Dict, Set, Type, TYPE_CHECKING
+from typing import Dict, Set, Tuple, Type, TYPE_CHECKING
 
 import attr
 
@@ -21,6 +22,15 @@ class Schema:
     ports: Dict[str, 'port.Port']
     signals: Set[str]
     slots: Set[str]
+    sorted_ports: Tuple[Tuple[str, 'port.Port'], ...] = attr.ib(init=False)
+    sorted_signals: Tuple[str, ...] = attr.ib(init=False)
+    sorted_slots: Tuple[str, ...] = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        """Sorts the schema members once, since they do not change."""
+        self.sorted_ports = tuple(sorted(self.ports.items()))
+        self.sorted_signals = tuple(sorted(self.signals))
+        self.sorted_slots = tuple(sorted(self.slots))
 
     @property
     def uid(self) -> str:
@@ -41,6 +51,7 @@ def generate(model: Type['node.Node']) -> Schema:
     for name, annotation in typing.get_type_hints(model).items():
         if name.startswith('_'):
             continue
+        name = sys.intern(name)
 
         if annotation is callbacks.Signal:
             signals.add(name)
@@ -54,7 +65,7 @@ def generate(model: Type['node.Node']) -> Schema:
     # extract slots from attributes
     for name, prop in inspect.getmembers(model):
         if getattr(prop, 'is_slot', False):
-            slots.add(name)
+            slots.add(sys.intern(name))
 
     schema = Schema(group=group_name,
                     name=model_name,
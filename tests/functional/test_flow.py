@@ -1,8 +1,12 @@
 """Test flow scenarios."""
 
+import asyncio
+import logging
+import sys
 import time
 
 import asyncmock
+import mock
 import pytest
 
 import mason
@@ -31,3 +35,223 @@ async def test_merge_node():
     assert merge.continue_.connection_count == 10
     assert elapsed < 0.15
     mock_print.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_log_node(caplog):
+    bp = mason.Blueprint()
+    logger = bp.create('log.Log', values={'name': 'mason.test',
+                                          'level': 'WARNING',
+                                          'message': 'Logged!'})
+    bp['triggered'].connect(logger.log)
+
+    with caplog.at_level(logging.WARNING, logger='mason.test'):
+        await bp()
+        logger.ports['level'].local_value = 'DEBUG'
+        await bp()
+
+    assert [record.getMessage() for record in caplog.records] == ['Logged!']
+
+
+@pytest.mark.asyncio
+async def test_set_node_with_static_and_connected_ports():
+    bp = mason.Blueprint()
+    bp.create('flow.Input', name='a')
+    static = bp.create('data.Set', values={'key': 'x', 'value': 1})
+    connected = bp.create('data.Set', values={'key': 'y',
+                                              'value': bp['a.value']})
+    bp['triggered'].connect(static.store)
+    bp['triggered'].connect(connected.store)
+
+    state = {}
+    await bp(state, a=3)
+    assert state == {'x': 1, 'y': 3}
+
+
+@pytest.mark.asyncio
+async def test_blueprint_installs_eager_task_factory(monkeypatch):
+    tasks = []
+
+    def task_factory(loop, coro, **kwargs):
+        tasks.append(coro)
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    monkeypatch.setattr(mason.node, '_EAGER_TASK_FACTORY', task_factory)
+    bp = mason.Blueprint(eager=True)
+    for _ in range(2):
+        sleep = bp.create('flow.Sleep', values={'seconds': 0})
+        bp['triggered'].connect(sleep.sleep)
+
+    await bp()
+    assert tasks
+    assert asyncio.get_running_loop().get_task_factory() is None
+
+    tasks.clear()
+    bp.eager = False
+    await bp()
+    assert not tasks
+
+
+@pytest.mark.asyncio
+async def test_blueprint_is_not_eager_by_default(monkeypatch):
+    factory = mock.Mock()
+    monkeypatch.setattr(mason.node, '_EAGER_TASK_FACTORY', factory)
+    bp = mason.Blueprint()
+    sleep = bp.create('flow.Sleep', values={'seconds': 0})
+    bp['triggered'].connect(sleep.sleep)
+
+    await bp()
+    factory.assert_not_called()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12),
+                    reason='asyncio.eager_task_factory requires Python 3.12')
+@pytest.mark.asyncio
+async def test_blueprint_runs_slots_eagerly():
+    loop = asyncio.get_running_loop()
+    factories = []
+    order = []
+
+    @mason.slot
+    async def first():
+        factories.append(loop.get_task_factory())
+        order.append('first')
+
+    @mason.slot
+    async def second():
+        order.append('second')
+
+    bp = mason.Blueprint(eager=True)
+    bp['triggered'].connect(first, second)
+
+    await bp()
+    assert factories == [asyncio.eager_task_factory]
+    assert sorted(order) == ['first', 'second']
+    assert loop.get_task_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_nodified_blueprint_runs():
+    @mason.nodify(node_type=mason.Blueprint)
+    @mason.slot
+    def noop():
+        """Blueprint type built through nodify."""
+
+    bp = noop.__node__()
+    assert bp.eager is False
+    assert await bp() is None
+
+
+@pytest.mark.asyncio
+async def test_log_node_with_invalid_level_only_fails_when_logging():
+    bp = mason.Blueprint()
+    logger = bp.create('log.Log', name='logger',
+                       values={'name': 'mason.test', 'level': 'LOUD'})
+    assert await bp() is None
+
+    bp['triggered'].connect(logger.log)
+    with pytest.raises(ValueError, match="'LOUD' for node logger"):
+        await bp()
+
+
+@pytest.mark.asyncio
+async def test_log_node_with_connected_level(caplog):
+    bp = mason.Blueprint()
+    bp.create('flow.Input', name='level')
+    logger = bp.create('log.Log', values={'name': 'mason.test',
+                                          'level': bp['level.value'],
+                                          'message': 'Logged!'})
+    bp['triggered'].connect(logger.log)
+
+    with caplog.at_level(logging.WARNING, logger='mason.test'):
+        await bp(level='ERROR')
+        await bp(level='DEBUG')
+
+    assert [record.levelname for record in caplog.records] == ['ERROR']
+
+
+@pytest.mark.asyncio
+async def test_for_node():
+    bp = mason.Blueprint()
+    loop = bp.create('flow.For', values={'start': 1, 'stop': 4})
+    store = bp.create('data.Set', values={'key': 'total',
+                                          'value': loop['index']})
+    bp['triggered'].connect(loop.run)
+    loop['index_changed'].connect(store.store)
+
+    state = {}
+    await bp(state)
+    assert state == {'total': 3}
+
+
+@pytest.mark.asyncio
+async def test_enumerate_node():
+    bp = mason.Blueprint()
+    loop = bp.create('flow.Enumerate', values={'items': ['a', 'b', 'c']})
+    index = bp.create('data.Set', values={'key': 'index',
+                                          'value': loop['index']})
+    item = bp.create('data.Set', values={'key': 'item',
+                                         'value': loop['item']})
+    bp['triggered'].connect(loop.run)
+    loop['item_changed'].connect(index.store)
+    loop['item_changed'].connect(item.store)
+
+    state = {}
+    await bp(state)
+    assert state == {'index': 2, 'item': 'c'}
+
+
+@pytest.mark.asyncio
+async def test_for_node_cancel():
+    bp = mason.Blueprint()
+    loop = bp.create('flow.For', values={'start': 0, 'stop': 10})
+    store = bp.create('data.Set', values={'key': 'index',
+                                          'value': loop['index']})
+    bp['triggered'].connect(loop.run)
+    loop['index_changed'].connect(store.store)
+    loop['index_changed'].connect(loop.cancel)
+
+    state = {}
+    await bp(state)
+    assert state == {'index': 0}
+    await bp(state)
+    assert state == {'index': 0}
+
+
+@pytest.mark.asyncio
+async def test_blueprint_binds_context_to_nodes_while_running():
+    bp = mason.Blueprint()
+    inner = bp.create(mason.Blueprint)
+    getter = inner.create('data.Get', values={'key': 'x'})
+    store = bp.create('data.Set', values={'key': 'y',
+                                          'value': getter['value']})
+    bp['triggered'].connect(store.store)
+
+    state = {'x': 1}
+    await bp(state)
+    assert state == {'x': 1, 'y': 1}
+    assert store._ctx is None  # pylint: disable=protected-access
+    assert getter._ctx is None  # pylint: disable=protected-access
+    assert store.get_context() is None
+
+
+@pytest.mark.asyncio
+async def test_log_node_skips_message_for_disabled_levels(caplog):
+    bp = mason.Blueprint()
+    message = bp.create('flow.Input', name='message')
+    logger = bp.create('log.Log', values={'name': 'mason.test',
+                                          'level': 'warn',
+                                          'message': message['value']})
+    bp['triggered'].connect(logger.log)
+
+    with asyncmock.patch.object(message.ports['value'], 'getter',
+                                return_value='Logged!') as mock_getter:
+        with caplog.at_level(logging.ERROR, logger='mason.test'):
+            await bp()
+        mock_getter.assert_not_called()
+
+        with caplog.at_level(logging.WARNING, logger='mason.test'):
+            await bp()
+        mock_getter.assert_called_once()
+
+    assert [record.levelname for record in caplog.records] == ['WARNING']
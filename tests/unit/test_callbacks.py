@@ -152,6 +152,51 @@ async def test_signal_emit_gathers_all_function_tasks():
         assert count == 3
 
 
+@pytest.mark.asyncio
+async def test_signal_freeze_holds_slots_until_unfrozen():
+    signal = callbacks.Signal()
+    calls = []
+
+    async def callback_a():
+        calls.append('a')
+
+    async def callback_b():
+        calls.append('b')
+
+    signal.connect(callback_a)
+    signal.freeze()
+    signal.freeze()
+    assert signal._frozen_slots == (callback_a,)
+
+    signal.connect(callback_b)
+    await signal.emit()
+    assert sorted(calls) == ['a', 'b']
+
+    signal.unfreeze()
+    assert signal._frozen_slots is not None
+    signal.unfreeze()
+    assert signal._frozen_slots is None
+    assert len(signal._get_active_slots()) == 2
+
+
+@pytest.mark.asyncio
+async def test_signal_emit_awaits_single_slot_directly():
+    signal = callbacks.Signal(int)
+    values = []
+
+    async def callback(value: int):
+        values.append(value)
+
+    with asyncmock.patch.object(asyncio,
+                                'gather',
+                                side_effect=asyncio.gather) as mock_gather:
+        await signal.emit(1)
+        signal.connect(callback)
+        await signal.emit(2)
+        mock_gather.assert_not_called()
+    assert values == [2]
+
+
 def test_slot_decorator_marks_function():
     @callbacks.slot
     def func():
@@ -0,0 +1,98 @@
+"""Test the command line interface."""
+# pylint: disable=protected-access, missing-function-docstring
+
+import importlib
+import sys
+
+from click import testing
+import mock
+import pytest
+
+from mason import cli
+
+_PLUGIN_SOURCE = '''
+import click
+
+from mason import cli
+
+
+@cli.cli.command()
+def plugged():
+    """Command from a plugin."""
+    click.echo('plugged')
+'''
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    (tmp_path / 'mason_test_plug.py').write_text(_PLUGIN_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(cli, '_MASON_CLI_PLUGS', {'mason_test_plug'})
+    monkeypatch.setattr(cli, '_LOADED_CLI_PLUGS', {})
+    monkeypatch.setattr(cli.cli, 'commands', dict(cli.cli.commands))
+    yield 'mason_test_plug'
+    sys.modules.pop('mason_test_plug', None)
+
+
+def test_cli_builtin_command_does_not_load_plugins(plugin):
+    with mock.patch('importlib.import_module') as mock_import:
+        result = testing.CliRunner().invoke(cli.cli, ['version'])
+    assert result.exit_code == 0, result.output
+    mock_import.assert_not_called()
+    assert plugin not in cli._LOADED_CLI_PLUGS
+
+
+def test_cli_lists_plugin_commands(plugin):
+    result = testing.CliRunner().invoke(cli.cli, ['--help'])
+    assert result.exit_code == 0, result.output
+    assert 'plugged' in result.output
+    assert cli._LOADED_CLI_PLUGS == {plugin: True}
+
+
+def test_cli_runs_lazily_loaded_plugin_command_once(plugin):
+    runner = testing.CliRunner()
+    with mock.patch('importlib.import_module',
+                    wraps=importlib.import_module) as mock_import:
+        for _ in range(2):
+            result = runner.invoke(cli.cli, ['plugged'])
+            assert result.exit_code == 0, result.output
+            assert result.output == 'plugged\n'
+        result = runner.invoke(cli.cli, ['--help'])
+        assert result.exit_code == 0, result.output
+    mock_import.assert_called_once_with(plugin)
+
+
+def test_cli_skips_missing_default_plugins(monkeypatch):
+    monkeypatch.setattr(cli, '_MASON_CLI_PLUGS', {'mason_missing_plug'})
+    monkeypatch.setattr(cli, '_DEFAULT_CLI_PLUGS', {'mason_missing_plug'})
+    monkeypatch.setattr(cli, '_LOADED_CLI_PLUGS', {})
+    result = testing.CliRunner().invoke(cli.cli, ['--help'])
+    assert result.exit_code == 0, result.output
+    assert cli._LOADED_CLI_PLUGS == {'mason_missing_plug': False}
+
+
+def test_cli_uvloop_env_installs_policy(monkeypatch):
+    monkeypatch.setenv('MASON_UVLOOP', '1')
+    uvloop = mock.MagicMock()
+    with mock.patch.dict(sys.modules, {'uvloop': uvloop}):
+        with mock.patch('asyncio.set_event_loop_policy') as mock_set_policy:
+            result = testing.CliRunner().invoke(cli.cli, ['version'])
+    assert result.exit_code == 0, result.output
+    mock_set_policy.assert_called_once_with(uvloop.EventLoopPolicy())
+
+
+def test_cli_uvloop_env_falls_back_without_uvloop(monkeypatch):
+    monkeypatch.setenv('MASON_UVLOOP', '1')
+    with mock.patch.dict(sys.modules, {'uvloop': None}):
+        with mock.patch('asyncio.set_event_loop_policy') as mock_set_policy:
+            result = testing.CliRunner().invoke(cli.cli, ['version'])
+    assert result.exit_code == 0, result.output
+    mock_set_policy.assert_not_called()
+
+
+def test_cli_uvloop_is_off_by_default(monkeypatch):
+    monkeypatch.delenv('MASON_UVLOOP', raising=False)
+    with mock.patch('mason.use_uvloop') as mock_use_uvloop:
+        result = testing.CliRunner().invoke(cli.cli, ['version'])
+    assert result.exit_code == 0, result.output
+    mock_use_uvloop.assert_not_called()
@@ -2,9 +2,16 @@
 # pylint: disable=protected-access, missing-function-docstring
 
 import enum
+import json
+import math
+import os
+
+from google.protobuf import json_format
 import mock
+import pytest
 
 from mason import callbacks
+from mason import exceptions
 from mason import io
 from mason import library
 from mason import node
@@ -25,6 +32,81 @@ def test_io_serialize_enum_stores_value():
     assert io._serialize(TempEnum.B) == '2'
 
 
+def test_io_parse_message_matches_json_format():
+    data = {
+        'name': 'test_blueprint',
+        'nodes': [
+            {'type': 'flow.Input', 'name': 'a',
+             'nodes': [{'type': 'flow.Input', 'name': 'b'}],
+             'ports': [{'name': 'default',
+                        'value': {'@type': io._STRING_VALUE_URL,
+                                  'value': '[1, 2]'}}]},
+            {'type': 'flow.Return', 'name': 'return'},
+        ],
+        'connections': [{'source': 'a.value', 'target': 'return.value'}],
+    }
+    expected = json_format.ParseDict(data, io.blueprint_pb2.Blueprint())
+    actual = io._parse_message(data, io.blueprint_pb2.Blueprint())
+    assert actual == expected
+    assert io._dump_message(actual) == json_format.MessageToDict(
+        expected, preserving_proto_field_name=True)
+
+
+def test_io_parse_message_accepts_json_names():
+    data = {'library': {'extendsDefault': True, 'modules': ['a']}}
+    actual = io._parse_message(data, io.config_pb2.Config())
+    assert actual.library.extends_default is True
+    assert list(actual.library.modules) == ['a']
+
+
+def test_io_parse_message_raises_parse_error_for_unknown_fields():
+    with pytest.raises(json_format.ParseError):
+        io._parse_message({'unknown': 1}, io.blueprint_pb2.Blueprint())
+
+
+@pytest.mark.parametrize('version', [2, '2', 2.0])
+def test_io_parse_message_coerces_scalars_like_json_format(version):
+    data = {'version': version}
+    expected = json_format.ParseDict(data, io.config_pb2.Library())
+    actual = io._parse_message(data, io.config_pb2.Library())
+    assert actual == expected
+    assert actual.version == 2
+
+
+@pytest.mark.parametrize('message_type, data', [
+    (io.config_pb2.Library, {'version': 'two'}),
+    (io.config_pb2.Library, {'version': 2.5}),
+    (io.config_pb2.Library, {'version': ' 2'}),
+    (io.config_pb2.Library, {'version': True}),
+    (io.config_pb2.Library, {'modules': [1]}),
+    (io.config_pb2.Library, {'modules': 'custom.nodes'}),
+    (io.config_pb2.Library, {'extendsDefault': 'yes'}),
+    (io.config_pb2.Config, {'library': 5}),
+    (io.blueprint_pb2.Blueprint, {'nodes': {'type': 'x'}}),
+    (io.blueprint_pb2.Blueprint, {'nodes': ['x']}),
+])
+def test_io_parse_message_raises_parse_error_for_bad_values(
+        message_type, data):
+    with pytest.raises(json_format.ParseError):
+        json_format.ParseDict(data, message_type())
+    with pytest.raises(json_format.ParseError):
+        io._parse_message(data, message_type())
+
+
+@pytest.mark.parametrize('value', [
+    'abc',
+    ['abc'],
+    {'@type': io._STRING_VALUE_URL, 'value': 5},
+])
+def test_io_parse_message_raises_parse_error_for_bad_port_values(value):
+    data = {'nodes': [{'type': 'flow.Input', 'name': 'a',
+                       'ports': [{'name': 'default', 'value': value}]}]}
+    with pytest.raises(json_format.ParseError):
+        json_format.ParseDict(data, io.blueprint_pb2.Blueprint())
+    with pytest.raises(json_format.ParseError):
+        io._parse_message(data, io.blueprint_pb2.Blueprint())
+
+
 def test_io_create_node():
     config = io.blueprint_pb2.Node(
         type='flow.Input',
@@ -73,14 +155,16 @@ def test_io_create_blueprint_with_nodes_and_connections():
         connections=connections
     )
     with mock.patch.object(node.Blueprint, 'connect') as mock_connect:
-        with mock.patch.object(io, '_create_node') as mock_create_node:
+        with mock.patch.object(io, '_create_node',
+                               wraps=io._create_node) as mock_create_node:
             bp = io._create_blueprint(config, library.get_default_library())
             assert isinstance(bp, node.Blueprint)
             assert bp.name == 'test_blueprint'
             mock_create_node.assert_any_call(nodes[0], bp)
             mock_create_node.assert_any_call(nodes[1], bp)
-            mock_connect.assert_any_call('a.value', 'return.value')
-            mock_connect.assert_any_call('triggered', 'return.return_')
+            mock_connect.assert_any_call(bp['a.value'], bp['return.value'])
+            mock_connect.assert_any_call(bp['triggered'],
+                                         bp['return.return_'])
 
 
 def test_io_dump_node_schema():
@@ -161,6 +245,13 @@ def test_io_dump_library():
     assert actual == expected
 
 
+def test_io_dump_library_matches_json_format():
+    lib = library.get_default_library()
+    with mock.patch.object(io, '_USE_JSON_FORMAT', True):
+        expected = io.dump_library(lib)
+    assert io.dump_library(lib) == expected
+
+
 def test_io_load_config_sets_default_library():
     data = {
         'library': {
@@ -214,3 +305,214 @@ def test_io_load_config_extends_default_library():
         mock_load.assert_any_call('custom.nodes2')
     finally:
         library.DefaultLibrary = _DefaultLibrary
+
+
+def test_io_load_data_caches_yaml_as_json(tmp_path):
+    source = tmp_path / 'blueprint.yaml'
+    source.write_text('name: cached\n')
+    cache_dir = tmp_path / 'cache'
+    with mock.patch.dict(os.environ, {'MASON_CACHE_DIR': str(cache_dir)}):
+        assert io._load_data(str(source)) == {'name': 'cached'}
+        assert len(os.listdir(cache_dir)) == 1
+        with mock.patch.object(io, '_load_yaml') as mock_load_yaml:
+            assert io._load_data(str(source)) == {'name': 'cached'}
+        mock_load_yaml.assert_not_called()
+
+
+@pytest.mark.parametrize('content', [
+    'created: 2020-01-02\n',
+    'at: 2020-01-02 03:04:05\n',
+    '1: numeric key\n',
+])
+def test_io_load_data_skips_cache_for_lossy_yaml(tmp_path, content):
+    source = tmp_path / 'blueprint.yaml'
+    source.write_text(content)
+    cache_dir = tmp_path / 'cache'
+    expected = io._load_yaml(content)
+    with mock.patch.dict(os.environ, {'MASON_CACHE_DIR': str(cache_dir)}):
+        assert io._load_data(str(source)) == expected
+        assert io._load_data(str(source)) == expected
+    assert not cache_dir.exists()
+
+
+def test_io_load_data_reloads_yaml_when_source_is_newer(tmp_path):
+    source = tmp_path / 'blueprint.yaml'
+    source.write_text('name: cached\n')
+    cache_dir = tmp_path / 'cache'
+    with mock.patch.dict(os.environ, {'MASON_CACHE_DIR': str(cache_dir)}):
+        io._load_data(str(source))
+        source.write_text('name: edited\n')
+        cache_file = io._get_cache_filename(str(source), str(cache_dir),
+                                             '.json')
+        mtime = os.stat(source).st_mtime_ns
+        os.utime(cache_file, ns=(mtime - 1, mtime - 1))
+        assert io._load_data(str(source)) == {'name': 'edited'}
+
+
+def test_io_load_blueprint_caches_parsed_config(tmp_path):
+    source = tmp_path / 'blueprint.yaml'
+    source.write_text('name: cached\n')
+    io._load_blueprint_config.cache_clear()
+    try:
+        with mock.patch.object(io, '_read_data',
+                               side_effect=io._read_data) as mock_read_data:
+            bp_a = io.load_blueprint(str(source))
+            bp_b = io.load_blueprint(str(source))
+        mock_read_data.assert_called_once_with(str(source))
+        assert bp_a is not bp_b
+        assert bp_a.name == bp_b.name == 'cached'
+    finally:
+        io._load_blueprint_config.cache_clear()
+
+
+def test_io_save_blueprint_pb_round_trips(tmp_path):
+    bp = node.Blueprint(name='test_blueprint')
+    bp.create('flow.Input', name='a', values={'default': 2})
+    bp.create('flow.Return', name='c', values={'value': bp['a.value']})
+    bp.connect('triggered', 'c.return_')
+
+    filename = str(tmp_path / 'blueprint.pb')
+    io.save_blueprint_pb(filename, bp)
+    actual = io.load_blueprint_pb(filename)
+
+    assert actual.name == 'test_blueprint'
+    assert actual.nodes.keys() == {'a', 'c'}
+    assert actual['a.default'].local_value == 2
+    assert actual['a'].uid == bp['a'].uid
+    assert actual['c.value'].is_connected
+    assert not actual['triggered'].is_empty
+
+
+def test_io_load_blueprint_caches_binary_config(tmp_path):
+    source = tmp_path / 'blueprint.yaml'
+    source.write_text('name: cached\n')
+    cache_dir = tmp_path / 'cache'
+    io._load_blueprint_config.cache_clear()
+    try:
+        with mock.patch.dict(os.environ, {'MASON_CACHE_DIR': str(cache_dir)}):
+            io.load_blueprint(str(source))
+        cache_files = os.listdir(cache_dir)
+        assert len(cache_files) == 1
+        assert cache_files[0].endswith('.pb')
+    finally:
+        io._load_blueprint_config.cache_clear()
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX file modes only.')
+def test_io_save_blueprint_keeps_file_modes(tmp_path):
+    filename = str(tmp_path / 'blueprint.pb')
+    umask = os.umask(0o022)
+    try:
+        io.save_blueprint(filename, node.Blueprint(name='bp'))
+        assert os.stat(filename).st_mode & 0o777 == 0o644
+
+        os.chmod(filename, 0o640)
+        io.save_blueprint(filename, node.Blueprint(name='bp'))
+        assert os.stat(filename).st_mode & 0o777 == 0o640
+    finally:
+        os.umask(umask)
+
+
+@pytest.mark.parametrize('extension', ['.yaml', '.json', '.pb'])
+def test_io_save_blueprint_round_trips(tmp_path, extension):
+    bp = node.Blueprint(name='test_blueprint')
+    bp.create('flow.Input', name='a', values={'default': 2})
+    bp.create('flow.Return', name='c', values={'value': bp['a.value']})
+    bp.connect('triggered', 'c.return_')
+
+    filename = str(tmp_path / f'blueprint{extension}')
+    io.save_blueprint(filename, bp)
+    actual = io.load_blueprint(filename)
+
+    expected = io.dump_blueprint(bp)
+    actual = io.dump_blueprint(actual)
+    for data in (expected, actual):
+        data['nodes'].sort(key=lambda item: item['name'])
+        data['connections'].sort(key=lambda item: item['source'])
+    assert actual == expected
+
+
+def test_io_write_data_writes_yaml_as_json(tmp_path):
+    filename = str(tmp_path / 'data.yaml')
+    with mock.patch.object(io, '_WRITE_YAML_AS_JSON', True):
+        io._write_data(filename, {'name': 'test'})
+    with open(filename) as f:
+        content = f.read()
+    assert content.startswith('{')
+    assert io._read_data(filename) == {'name': 'test'}
+
+
+def test_io_converts_deep_hierarchies_without_recursion():
+    depth = 1500
+    config = io.blueprint_pb2.Blueprint(name='test_blueprint')
+    nodes_config = config.nodes
+    for i in range(depth):
+        node_config = nodes_config.add(type='flow.Input', name=f'n{i}')
+        nodes_config = node_config.nodes
+
+    bp = io._create_blueprint(config, library.get_default_library())
+    actual = io._dump_blueprint_config(bp)
+
+    nodes_config = actual.nodes
+    for i in range(depth):
+        assert nodes_config[0].name == f'n{i}'
+        nodes_config = nodes_config[0].nodes
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_io_save_blueprints_round_trips(tmp_path, compress):
+    blueprints = [node.Blueprint(name=f'bp-{i}') for i in range(3)]
+    for bp in blueprints:
+        bp.create('flow.Input', name='a', values={'default': bp.name})
+
+    filename = str(tmp_path / 'blueprints.pbs')
+    io.save_blueprints(filename, blueprints, compress=compress)
+    actual = io.load_blueprints(filename)
+
+    assert [bp.name for bp in actual] == ['bp-0', 'bp-1', 'bp-2']
+    assert [bp['a.default'].local_value for bp in actual] == [
+        'bp-0', 'bp-1', 'bp-2']
+
+
+@pytest.mark.parametrize('name', ['blueprints.pbs', 'blueprints.pb'])
+@pytest.mark.parametrize('compress', [False, True])
+def test_io_load_blueprint_rejects_batch_files(tmp_path, name, compress):
+    filename = str(tmp_path / name)
+    io.save_blueprints(filename, [node.Blueprint(name='bp')],
+                       compress=compress)
+
+    with pytest.raises(exceptions.BlueprintFormatError):
+        io.load_blueprint(filename)
+    if name.endswith('.pb'):
+        with pytest.raises(exceptions.BlueprintFormatError):
+            io.load_blueprint_pb(filename)
+
+
+def test_io_load_blueprints_rejects_single_blueprint(tmp_path):
+    filename = str(tmp_path / 'blueprint.pb')
+    io.save_blueprint(filename, node.Blueprint(name='bp'))
+
+    with pytest.raises(exceptions.BlueprintFormatError):
+        io.load_blueprints(filename)
+
+
+class _Level(enum.IntEnum):
+    LOW = 1
+
+
+@pytest.mark.parametrize('value', [
+    1, 1.5, 1e20, 'text', 'caf\u00e9', None, True, [1, 2],
+    {'a': [1, {'b': 'c'}]}, float('nan'), float('inf'), _Level.LOW])
+def test_io_encode_json_matches_stdlib(value):
+    encoded = io._encode_json(value)
+    assert encoded == json.dumps(value, default=io._serialize)
+    decoded = json.loads(encoded)
+    if isinstance(value, float) and math.isnan(value):
+        assert math.isnan(decoded)
+    else:
+        assert decoded == value
+
+
+def test_io_dump_port_schema_default_uses_stdlib_format():
+    port_schema = port.Port(list, name='items', default=[1, 2])
+    assert io._dump_port_schema(port_schema)['default'] == '[1, 2]'
@@ -7,6 +7,7 @@ import pytest
 
 from mason import nodes
 from mason import library
+from mason import node
 
 
 @pytest.fixture
@@ -55,3 +56,14 @@ def test_library_get_default_caches():
         mock_lib.assert_called_once_with()
     finally:
         library.get_default_library.cache_clear()
+
+
+def test_library_sorted_types_updates_on_register():
+    lib = library.Library(modules=['mason.nodes.math'])
+    node_types, blueprint_types = lib.sorted_types()
+    assert [uid for uid, _ in node_types] == sorted(lib.node_types)
+    assert blueprint_types == ()
+    assert lib.sorted_types()[0] is node_types
+
+    lib.register(node.Blueprint)
+    assert lib.sorted_types()[1] == (('node.Blueprint', node.Blueprint),)
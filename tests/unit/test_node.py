@@ -1,6 +1,10 @@
 """Tests the mason framework node system."""
 # pylint: disable=protected-access, missing-function-docstring, redefined-outer-name
 
+import asyncio
+import contextlib
+import sys
+
 import mock
 import pytest
 
@@ -11,6 +15,94 @@ from mason import port
 from mason import schema
 
 
+@contextlib.contextmanager
+def record_call(obj, name):
+    """Temporarily replaces a method with one that records its arguments."""
+    calls = []
+    original = obj.__dict__.get(name)
+    setattr(obj, name, lambda *args: calls.append(args))
+    try:
+        yield calls
+    finally:
+        if original is None:
+            delattr(obj, name)
+        else:
+            setattr(obj, name, original)
+
+
+class EmptyNode(node.Node):
+    """Test node without any members."""
+
+
+class XYNode(node.Node):
+    """Test node with two input ports."""
+
+    x: int = 0
+    y: int = 0
+
+
+class SignalNode(node.Node):
+    """Test node with a signal and a slot."""
+
+    triggered: callbacks.Signal
+
+    @callbacks.slot
+    def trigger(self):
+        pass
+
+
+class NestedIONode(node.Node):
+    """Test node with input and output ports, a signal and a slot."""
+
+    x: int
+    y: int
+    value: port.Port(int, direction=port.PortDirection.Output)
+
+    triggered: callbacks.Signal
+
+    @callbacks.slot
+    def trigger(self):
+        pass
+
+
+@pytest.fixture
+def empty_node_type():
+    return EmptyNode
+
+
+@pytest.fixture
+def xy_node_type():
+    return XYNode
+
+
+@pytest.fixture
+def signal_node_type():
+    return SignalNode
+
+
+@pytest.fixture
+def nested_io_node_type():
+    return NestedIONode
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _prime_default_library():
+    """Loads the default library once, before any node test uses it."""
+    library.get_default_library()
+
+
+@pytest.fixture(scope='module')
+def shared_library():
+    """Empty library for tests that do not register anything."""
+    return library.Library()
+
+
+@pytest.fixture
+def fresh_library():
+    """Empty library for tests that register types."""
+    return library.Library()
+
+
 def test_node_definition_with_no_properties_generates_schema():
     class TestNode(node.Node):
         """Test node."""
@@ -84,72 +176,70 @@ def test_node_abstraction_raises_error():
         node.Node()
 
 
-def test_node_library_is_default_library():
-    class TestNode(node.Node):
-        """Test node."""
-
-    test_node = TestNode()
+def test_node_library_is_default_library(empty_node_type):
+    test_node = empty_node_type()
     assert test_node.library is library.get_default_library()
 
 
-def test_node_library_overrides_default_library():
-    lib = library.Library()
-
-    class TestNode(node.Node):
-        """Test node."""
+def test_node_library_overrides_default_library(empty_node_type,
+                                                shared_library):
+    test_node = empty_node_type(library=shared_library)
+    assert test_node.library is shared_library
 
-    test_node = TestNode(library=lib)
-    assert test_node.library is lib
 
+def test_node_library_inheritance(empty_node_type, shared_library):
+    test_parent = empty_node_type(library=shared_library)
+    test_node = empty_node_type(parent=test_parent)
 
-def test_node_library_inheritance():
-    lib = library.Library()
+    assert test_parent.library is shared_library
+    assert test_node.library is shared_library
 
-    class TestNode(node.Node):
-        """Test node."""
 
-    test_parent = TestNode(library=lib)
-    test_node = TestNode(parent=test_parent)
+def test_node_library_follows_reparenting(empty_node_type):
+    lib_a = library.Library()
+    lib_b = library.Library()
 
-    assert test_parent.library is lib
-    assert test_node.library is lib
+    parent_a = empty_node_type(library=lib_a)
+    parent_b = empty_node_type(library=lib_b)
+    test_node = empty_node_type(parent=parent_a)
+    test_child = empty_node_type(parent=test_node)
+    assert test_child.library is lib_a
 
+    test_node.parent = parent_b
+    assert test_node.library is lib_b
+    assert test_child.library is lib_b
 
-def test_node_automatically_generates_uid():
-    class TestNode(node.Node):
-        """Test node."""
 
-    test_node = TestNode()
+def test_node_automatically_generates_uid(empty_node_type):
+    test_node = empty_node_type()
     assert bool(test_node.uid) is True
 
 
-def test_node_setting_uid_overrides_generated():
-    class TestNode(node.Node):
-        """Test node."""
-
-    test_node = TestNode(uid='unique-id')
+def test_node_setting_uid_overrides_generated(empty_node_type):
+    test_node = empty_node_type(uid='unique-id')
     assert test_node.uid == 'unique-id'
 
 
 def test_node_initializes_schema_on_init():
+    captured = []
+
     class TestNode(node.Node):
         """Test node."""
 
         x: int
         y: int
 
-    with mock.patch.object(TestNode, '_init_schema') as mock_init:
-        TestNode(values=dict(x=1, y=2))
-        mock_init.assert_called_once_with(TestNode.__schema__, {'x': 1, 'y': 2})
+        def _init_schema(self, my_schema, values):
+            captured.append((my_schema, values))
 
+    TestNode(values=dict(x=1, y=2))
+    assert captured == [(TestNode.__schema__, {'x': 1, 'y': 2})]
 
-def test_node_initialize_with_children_reparents_them():
-    class TestNode(node.Node):
-        """Test node."""
 
-    a = TestNode(name='a')
-    b = TestNode(name='b')
-    c = TestNode(nodes=[a, b])
+def test_node_initialize_with_children_reparents_them(empty_node_type):
+    a = empty_node_type(name='a')
+    b = empty_node_type(name='b')
+    c = empty_node_type(nodes=[a, b])
     assert a.parent is c
     assert b.parent is c
     assert c.nodes == {'a': a, 'b': b}
@@ -184,200 +274,202 @@ def test_node_getitem_traverses_hierarchy():
     assert a['__self__.x'] == a['x'] == a.ports['x']
 
 
-def test_node_initialization_with_values_overrides_defaults():
-    class TestNode(node.Node):
-        """Test node."""
-        x: int = 0
-        y: int = 0
-
-    a = TestNode()
-    b = TestNode(values=dict(x=1, y=2))
+def test_node_initialization_with_values_overrides_defaults(xy_node_type):
+    a = xy_node_type()
+    b = xy_node_type(values=dict(x=1, y=2))
     assert a.ports['x'].local_value == 0
     assert a.ports['y'].local_value == 0
     assert b.ports['x'].local_value == 1
     assert b.ports['y'].local_value == 2
 
 
-def test_node_connection_is_shortcut_for_port_connection():
-    class TestNode(node.Node):
-        """Test node."""
-        x: int = 0
-        y: int = 0
-
-    a = TestNode()
-
-    with mock.patch.object(a.ports['x'], 'connect') as mock_connect:
-        a.connect('x', 'y')
-    mock_connect.assert_called_once_with(a.ports['y'])
-
-
-def test_node_connection_is_shortcut_for_signal_connection():
-    class TestNode(node.Node):
-        """Test node."""
-
-        triggered: callbacks.Signal
-
-        @callbacks.slot
-        def trigger(self):
-            pass
-
-    a = TestNode()
-    with mock.patch.object(a.signals['triggered'], 'connect') as mock_connect:
-        a.connect('triggered', 'trigger')
-    mock_connect.assert_called_once_with(a.trigger)
-
+@pytest.mark.parametrize('method', ['connect', 'disconnect'])
+@pytest.mark.parametrize('owner, source, target', [
+    ('a', 'x', 'y'),
+    ('a', 'triggered', 'trigger'),
+    ('c', 'a.value', 'b.x'),
+    ('c', 'a.triggered', 'b.trigger'),
+])
+def test_node_connection_methods_are_shortcuts(nested_io_node_type,
+                                               method,
+                                               owner,
+                                               source,
+                                               target):
+    a = nested_io_node_type(name='a')
+    b = nested_io_node_type(name='b')
+    c = nested_io_node_type(nodes=[a, b])
+    owner_node = {'a': a, 'c': c}[owner]
+
+    with record_call(owner_node[source], method) as calls:
+        getattr(owner_node, method)(source, target)
+    assert calls == [(owner_node[target],)]
+
+
+def test_node_create_with_type_and_name_uses_no_defaults(empty_node_type):
+    a = empty_node_type(name='a')
+    b = a.create(empty_node_type, name='b')
+    assert a.nodes == {'b': b}
+    assert b.parent == a
 
-def test_node_connection_is_shortcut_to_nested_connections():
-    class TestNode(node.Node):
-        """Test node."""
-        x: int
-        y: int
-        value: port.Port(int, direction=port.PortDirection.Output)
 
-        triggered: callbacks.Signal
+def test_node_create_with_type_generates_automatic_name(empty_node_type):
+    a = empty_node_type(name='a')
+    b = a.create(empty_node_type)
+    c = a.create(empty_node_type)
+    assert b.name == 'emptynode-01'
+    assert c.name == 'emptynode-02'
 
-        @callbacks.slot
-        def trigger(self):
-            pass
 
-    a = TestNode(name='a')
-    b = TestNode(name='b')
-    c = TestNode(nodes=[a, b])
+def test_node_create_with_string_creates_from_library(empty_node_type,
+                                                     fresh_library):
+    fresh_library.register(empty_node_type)
 
-    with mock.patch.object(a.ports['value'], 'connect') as mock_connect_port:
-        with mock.patch.object(a.signals['triggered'],
-                               'connect') as mock_connect_signal:
-            c.connect('a.value', 'b.x')
-            c.connect('a.triggered', 'b.trigger')
+    a = empty_node_type(name='a', library=fresh_library)
+    b = a.create('test_node.EmptyNode')
+    c = a.create('test_node.EmptyNode')
 
-    mock_connect_port.assert_called_once_with(b.ports['x'])
-    mock_connect_signal.assert_called_once_with(b.trigger)
+    assert b.name == 'emptynode-01'
+    assert c.name == 'emptynode-02'
 
 
-def test_node_create_with_type_and_name_uses_no_defaults():
-    class TestNode(node.Node):
-        """Test node."""
+def test_node_create_with_missing_type_raises_error(empty_node_type,
+                                                    shared_library):
+    a = empty_node_type(name='a', library=shared_library)
+    with pytest.raises(KeyError):
+        a.create('test_node.EmptyNode')
 
-    a = TestNode(name='a')
-    b = a.create(TestNode, name='b')
-    assert a.nodes == {'b': b}
-    assert b.parent == a
 
+def test_node_delete_removes_from_hierarchy(empty_node_type):
+    a = empty_node_type()
+    b = empty_node_type(parent=a)
 
-def test_node_create_with_type_generates_automatic_name():
-    class TestNode(node.Node):
-        """Test node."""
+    assert len(a.nodes) == 1
+    b.delete()
+    assert len(a.nodes) == 0
 
-    a = TestNode(name='a')
-    b = a.create(TestNode)
-    c = a.create(TestNode)
-    assert b.name == 'testnode-01'
-    assert c.name == 'testnode-02'
 
+def test_node_disconnection_works_without_target(xy_node_type):
+    a = xy_node_type()
+    with record_call(a.ports['x'], 'disconnect') as calls:
+        a.disconnect('x')
+    assert calls == [(None,)]
 
-def test_node_create_with_string_creates_from_library():
-    class TestNode(node.Node):
-        """Test node."""
 
-    lib = library.Library()
-    lib.register(TestNode)
+def test_node_connect_accepts_resolved_endpoints(xy_node_type):
+    a = xy_node_type()
 
-    a = TestNode(name='a', library=lib)
-    b = a.create('test_node.TestNode')
-    c = a.create('test_node.TestNode')
+    with record_call(a.ports['x'], 'connect') as calls:
+        a.connect(a.ports['x'], 'y')
+    assert calls == [(a.ports['y'],)]
 
-    assert b.name == 'testnode-01'
-    assert c.name == 'testnode-02'
 
+def test_node_path_lookup_follows_hierarchy_changes(xy_node_type):
+    a = xy_node_type(name='a')
+    b = xy_node_type(name='b', nodes=[a])
+    root = xy_node_type(name='root', nodes=[b])
+    other = xy_node_type(name='other')
 
-def test_node_create_with_missing_type_raises_error():
-    class TestNode(node.Node):
-        """Test node."""
+    assert root['b.a.x'] is a.ports['x']
+    assert root['b.a.x'] is a.ports['x']
 
-    lib = library.Library()
-
-    a = TestNode(name='a', library=lib)
+    a.parent = other
     with pytest.raises(KeyError):
-        a.create('test_node.TestNode')
+        root['b.a.x']  # pylint: disable=pointless-statement
+    assert other['a.x'] is a.ports['x']
 
 
-def test_node_delete_removes_from_hierarchy():
-    class TestNode(node.Node):
-        """Test node."""
+def test_node_use_uvloop_without_uvloop_installed():
+    with mock.patch.dict(sys.modules, {'uvloop': None}):
+        with mock.patch('asyncio.set_event_loop_policy') as mock_set_policy:
+            assert not node.use_uvloop()
+    mock_set_policy.assert_not_called()
 
-    a = TestNode()
-    b = TestNode(parent=a)
 
-    assert len(a.nodes) == 1
-    b.delete()
-    assert len(a.nodes) == 0
+def test_node_use_uvloop_installs_policy():
+    uvloop = mock.MagicMock()
+    with mock.patch.dict(sys.modules, {'uvloop': uvloop}):
+        with mock.patch('asyncio.set_event_loop_policy') as mock_set_policy:
+            assert node.use_uvloop()
+    mock_set_policy.assert_called_once_with(uvloop.EventLoopPolicy())
 
 
-def test_node_disconnection_is_shortcut_for_port_connection():
+@pytest.mark.asyncio
+async def test_node_gather_only_schedules_connected_ports():
     class TestNode(node.Node):
         """Test node."""
-        x: int = 0
-        y: int = 0
+        x: int = 1
+        y: int = 2
+        z: int = 3
+        value: port.Port(int, direction=port.PortDirection.Output)
 
     a = TestNode()
+    b = TestNode()
+    b.ports['value'].getter = mock.AsyncMock(return_value=10)
+    a.connect('x', b.ports['value'])
+    a.connect('z', b.ports['value'])
+
+    with mock.patch('asyncio.gather', wraps=asyncio.gather) as mock_gather:
+        assert await a.gather('y') == [2]
+        assert await a.gather('x', 'y') == [10, 2]
+        mock_gather.assert_not_called()
+        assert await a.gather('x', 'y', 'z') == [10, 2, 10]
+        mock_gather.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_node_emit_skips_signals_without_slots(signal_node_type):
+    a = signal_node_type()
+    with mock.patch.object(a.signals['triggered'], 'emit') as mock_emit:
+        await a.emit('triggered')
+        mock_emit.assert_not_called()
+
+        async def callback():
+            pass
 
-    with mock.patch.object(a.ports['x'], 'disconnect') as mock_disconnect:
-        a.disconnect('x', 'y')
-    mock_disconnect.assert_called_once_with(a.ports['y'])
+        a.signals['triggered'].connect(callback)
+        await a.emit('triggered')
+        mock_emit.assert_called_once_with()
 
 
-def test_node_disconnection_is_shortcut_for_signal_connection():
-    class TestNode(node.Node):
-        """Test node."""
+def test_node_children_with_duplicate_uids_are_kept(empty_node_type):
+    parent = empty_node_type(name='parent')
+    a = empty_node_type(name='a', uid='same', parent=parent)
+    b = empty_node_type(name='b', uid='same', parent=parent)
+    assert parent.nodes == {'a': a, 'b': b}
 
-        triggered: callbacks.Signal
+    a.parent = None
+    assert parent.nodes == {'b': b}
+    assert b.parent is parent
 
-        @callbacks.slot
-        def trigger(self):
-            pass
 
-    a = TestNode()
-    with mock.patch.object(a.signals['triggered'],
-                           'disconnect') as mock_disconnect:
-        a.disconnect('triggered', 'trigger')
-    mock_disconnect.assert_called_once_with(a.trigger)
+def test_node_reparenting_after_uid_change(empty_node_type):
+    parent = empty_node_type(name='parent')
+    other = empty_node_type(name='other')
+    a = empty_node_type(name='a', parent=parent)
 
+    a.uid = 'changed'
+    a.parent = other
+    assert parent.nodes == {}
+    assert other.nodes == {'a': a}
 
-def test_node_disconnection_is_shortcut_to_nested_connections():
-    class TestNode(node.Node):
-        """Test node."""
-        x: int
-        y: int
-        value: port.Port(int, direction=port.PortDirection.Output)
-
-        triggered: callbacks.Signal
 
-        @callbacks.slot
-        def trigger(self):
-            pass
-
-    a = TestNode(name='a')
-    b = TestNode(name='b')
-    c = TestNode(nodes=[a, b])
+def test_node_path_lookup_follows_renames(xy_node_type):
+    a = xy_node_type(name='a')
+    b = xy_node_type(name='b', nodes=[a])
+    root = xy_node_type(name='root', nodes=[b])
+    assert root['b.a.x'] is a.ports['x']
 
-    with mock.patch.object(a.ports['value'],
-                           'disconnect') as mock_disconnect_port:
-        with mock.patch.object(a.signals['triggered'],
-                               'disconnect') as mock_disconnect_signal:
-            c.disconnect('a.value', 'b.x')
-            c.disconnect('a.triggered', 'b.trigger')
-
-    mock_disconnect_port.assert_called_once_with(b.ports['x'])
-    mock_disconnect_signal.assert_called_once_with(b.trigger)
+    a.name = 'renamed'
+    with pytest.raises(KeyError):
+        root['b.a.x']  # pylint: disable=pointless-statement
+    assert root['b.renamed.x'] is a.ports['x']
 
 
-def test_node_disconnection_works_without_target():
+def test_node_name_port_does_not_shadow_node_name():
     class TestNode(node.Node):
         """Test node."""
-        x: int
-        y: int
+        name: str = 'root'
 
-    a = TestNode()
-    with mock.patch.object(a.ports['x'], 'disconnect') as mock_disconnect:
-        a.disconnect('x')
-    mock_disconnect.assert_called_once_with(None)
+    a = TestNode(name='a')
+    assert a.name == 'a'
+    assert a.ports['name'].local_value == 'root'